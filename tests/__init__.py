@@ -516,6 +516,38 @@ def test__filter_enums_params():
     ]
 
 
+def test__filter_strings_params():
+    """
+    Params for test__filter_strings.
+    """
+    area_values = ["kb1_area", "kb2_area", "og1_area"]
+    traces_values = ["kb1_traces", "kb2_traces", "og1_traces"]
+    thematic_values = ["loviisa", "loviisa", "other"]
+    scale_values = ["20m", "20m", "20m"]
+    return [
+        (
+            (area_values, traces_values, thematic_values, scale_values),
+            dict(),
+            [True, True, True],
+        ),
+        (
+            (area_values, traces_values, thematic_values, scale_values),
+            dict(traces=["kb"]),
+            [True, True, False],
+        ),
+        (
+            (area_values, traces_values, thematic_values, scale_values),
+            dict(area=["kb1", "og"], thematic=["loviisa"]),
+            [True, False, False],
+        ),
+        (
+            (area_values, traces_values, thematic_values, scale_values),
+            dict(scale=["100m"]),
+            [False, False, False],
+        ),
+    ]
+
+
 def lines_in_file(path_str: str) -> List[str]:
     """
     Extract each line in file at ``path_str`` as a list of strings.
@@ -718,6 +750,32 @@ def test_sort_update_tuples_to_match_invalids_params():
     ]
 
 
+def test_unique_invalids_params():
+    """
+    Params for test_unique_invalids.
+    """
+
+    def trace_tuple(traces_name: str, area_name: str) -> TraceTuple:
+        return TraceTuple(
+            traces_path=Path(f"{traces_name}.{rules.FILETYPE}"),
+            area_path=Path(f"{area_name}.{rules.FILETYPE}"),
+            validity=rules.ValidationResults.INVALID.value,
+        )
+
+    return [
+        ([], 0),
+        ([trace_tuple("a_traces", "a_area")], 1),
+        (
+            [
+                trace_tuple("b_traces", "a_area"),
+                trace_tuple("a_traces", "b_area"),
+                trace_tuple("b_traces", "c_area"),
+            ],
+            2,
+        ),
+    ]
+
+
 def test_perform_pandera_check_params():
     """
     Params for test_perform_pandera_check.
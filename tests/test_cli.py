@@ -4,6 +4,7 @@ Tests for cli.py.
 
 from pathlib import Path
 from shutil import copytree, rmtree
+from types import SimpleNamespace
 from warnings import warn
 
 import geopandas as gpd
@@ -15,7 +16,15 @@ from typer.testing import CliRunner
 
 import tests
 from tracerepo import repo, rules, spatial, utils
-from tracerepo.cli import app, export_data, format_repo_geojson, load_metadata_from_json
+from tracerepo.cli import (
+    CliState,
+    app,
+    export_data,
+    format_repo_geojson,
+    get_organizer,
+    load_metadata_from_json,
+    remove_directory_in_background,
+)
 
 runner = CliRunner()
 
@@ -223,6 +232,16 @@ def test_export_data(tmp_path, driver):
     for shp in export_dir_path.rglob(f"*{spatial.DRIVER_EXTENSIONS[driver]}"):
         assert isinstance(gpd.read_file(shp), gpd.GeoDataFrame)
 
+    # Exporting again is only allowed with overwrite
+    with pytest.raises(FileExistsError):
+        export_data(
+            destination=tmp_path,
+            driver=driver,
+            database=database_path,
+            tracerepository_path=tmp_path,
+            overwrite=False,
+        )
+
 
 def test_format_geojson(tmp_path):
     """
@@ -389,3 +408,58 @@ def test_load_metadata_from_json(metadata_json_path: Path):
     """
     result = load_metadata_from_json(metadata_json_path=metadata_json_path)
     assert isinstance(result, rules.Metadata)
+
+    # Unchanged file is parsed only once
+    assert result is load_metadata_from_json(metadata_json_path=metadata_json_path)
+
+
+def test_get_organizer():
+    """
+    Test get_organizer.
+    """
+    tracerepository_path = tests.READY_TRACEREPOSITORY_PATH
+    database = tracerepository_path / rules.DATABASE_CSV
+    ctx = SimpleNamespace(obj=CliState())
+
+    organizer = get_organizer(
+        ctx=ctx, tracerepository_path=tracerepository_path, database=database
+    )
+    assert organizer is get_organizer(
+        ctx=ctx, tracerepository_path=tracerepository_path, database=database
+    )
+    assert organizer is not get_organizer(
+        ctx=None, tracerepository_path=tracerepository_path, database=database
+    )
+
+
+def test_load_metadata_from_json_json5(tmp_path: Path):
+    """
+    Test load_metadata_from_json with json5 only syntax.
+    """
+    metadata_json_path = tmp_path / rules.PathNames.METADATA.value
+    metadata_json_path.write_text(
+        "// Comments are only allowed in json5\n"
+        + tests.METADATA_JSON_PATH.read_text()
+    )
+    result = load_metadata_from_json(metadata_json_path=metadata_json_path)
+    assert isinstance(result, rules.Metadata)
+
+
+def test_remove_directory_in_background(tmp_path: Path):
+    """
+    Test remove_directory_in_background.
+    """
+    directory = tmp_path / "directory"
+    (directory / "subdirectory").mkdir(parents=True)
+    (directory / "subdirectory" / "file.txt").write_text("text")
+
+    thread = remove_directory_in_background(directory)
+
+    # Path is freed immediately
+    assert not directory.exists()
+    assert thread is not None
+    thread.join()
+    assert list(tmp_path.iterdir()) == []
+
+    with pytest.raises(FileNotFoundError):
+        remove_directory_in_background(directory)
@@ -269,3 +269,77 @@ def test__filter_enums(
     assert isinstance(result, Sequence)
 
     assert result == assume_result
+
+
+def test_organizer_update_many_organized(organizer_unorganized: Organizer):
+    """
+    Test Organizer update_many.
+    """
+    _, area_name, _, _, *_ = tests.df_data()
+    organizer_unorganized.update_many(
+        updates=[
+            (
+                area_name,
+                {
+                    rules.ColumnNames.VALIDITY: rules.ValidationResults.VALID.value,
+                    rules.ColumnNames.AREA_SHAPE: rules.AreaShapes.OTHER.value,
+                },
+            )
+        ]
+    )
+    assert (
+        organizer_unorganized.columns[rules.ColumnNames.VALIDITY.value][0]
+        == rules.ValidationResults.VALID.value
+    )
+    assert (
+        organizer_unorganized.columns[rules.ColumnNames.AREA_SHAPE.value][0]
+        == rules.AreaShapes.OTHER.value
+    )
+
+    with pytest.raises(ValueError):
+        organizer_unorganized.update_many(
+            updates=[
+                (
+                    "not_in_database_area",
+                    {rules.ColumnNames.VALIDITY: rules.ValidationResults.VALID.value},
+                )
+            ]
+        )
+
+
+def test_organizer_query_cache(organizer_unorganized: Organizer):
+    """
+    Test that Organizer query results are cached until the database is updated.
+    """
+    _, area_name, _, _, *_ = tests.df_data()
+    invalid_filter = [rules.ValidationResults.INVALID]
+    assert len(organizer_unorganized.query(validity=invalid_filter)) == 1
+    assert len(organizer_unorganized._query_cache) == 1
+    assert len(organizer_unorganized.query(validity=invalid_filter)) == 1
+
+    organizer_unorganized.update(
+        area_name=area_name,
+        update_values={rules.ColumnNames.VALIDITY: rules.ValidationResults.VALID.value},
+    )
+    assert len(organizer_unorganized._query_cache) == 0
+    assert len(organizer_unorganized.query(validity=invalid_filter)) == 0
+
+
+@pytest.mark.parametrize(
+    "values,filters,assume_result", tests.test__filter_strings_params()
+)
+def test__filter_strings(values, filters, assume_result):
+    """
+    Test _filter_strings.
+    """
+    area_values, traces_values, thematic_values, scale_values = values
+    result = Organizer._filter_strings(
+        area_values=area_values,
+        traces_values=traces_values,
+        thematic_values=thematic_values,
+        scale_values=scale_values,
+        query_bools=[True] * len(area_values),
+        **filters,
+    )
+
+    assert list(result) == assume_result
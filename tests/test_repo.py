@@ -2,6 +2,7 @@
 Tests for repo.py.
 """
 
+import os
 from pathlib import Path
 
 import pandas as pd
@@ -33,3 +34,77 @@ def test_read_database_csv(database_csv):
     database_csv = repo.read_database_csv(path=path)
     validated = rules.database_schema().validate(database_csv)
     assert isinstance(validated, pd.DataFrame)
+
+
+def test_read_database_csv_cached(database_csv):
+    """
+    Test read_database_csv_cached.
+    """
+    path = database_csv
+    first = repo.read_database_csv_cached(path=path)
+    second = repo.read_database_csv_cached(path=path)
+    assert first is not second
+    pd.testing.assert_frame_equal(first, second)
+
+    # Changes to the file invalidate the cached database
+    repo.write_database_csv(path=path, database=pd.concat([first, first]))
+    third = repo.read_database_csv_cached(path=path)
+    assert third.shape[0] == 2 * first.shape[0]
+
+
+def test_write_database_csv(database_csv):
+    """
+    Test write_database_csv.
+    """
+    path = database_csv
+    database = repo.read_database_csv(path=path)
+    repo.write_database_csv(path=path, database=database)
+
+    # Temporary file is replaced by the database.csv
+    assert list(path.parent.glob(f"{path.name}.tmp")) == []
+    pd.testing.assert_frame_equal(repo.read_database_csv(path=path), database)
+
+
+def test_write_database_csv_invalidates_cache(database_csv):
+    """
+    Test that write_database_csv invalidates read_database_csv_cached.
+    """
+    path = database_csv
+    database = repo.read_database_csv_cached(path=path)
+    assert repo._read_database_csv_stat_keyed.cache_info().currsize > 0
+
+    # Modify a single value and write without touching the file metadata
+    # used in the cache key
+    stat = path.stat()
+    area_name = database.index[0]
+    database.loc[area_name, rules.ColumnNames.VALIDITY.value] = (
+        rules.ValidationResults.CRITICAL.value
+    )
+    repo.write_database_csv(path=path, database=database)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert repo._read_database_csv_stat_keyed.cache_info().currsize == 0
+    reread = repo.read_database_csv_cached(path=path)
+    assert (
+        reread.loc[area_name, rules.ColumnNames.VALIDITY.value]
+        == rules.ValidationResults.CRITICAL.value
+    )
+
+
+def test_write_database_csv_failure(database_csv, monkeypatch):
+    """
+    Test that a failed write_database_csv keeps the original database.csv.
+    """
+    path = database_csv
+    original = path.read_bytes()
+    database = repo.read_database_csv(path=path)
+
+    def fail_replace(*_, **__):
+        raise OSError("Simulated failure.")
+
+    monkeypatch.setattr(repo.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        repo.write_database_csv(path=path, database=database)
+
+    assert path.read_bytes() == original
+    assert list(path.parent.glob(f"{path.name}.tmp")) == []
@@ -114,6 +114,43 @@ def test_validate_invalids(invalids, will_fail):
         assert not failed
 
 
+def test_validate_invalids_cached(tmp_path: Path, monkeypatch):
+    """
+    Test validate_invalids_cached.
+    """
+    traces_path = tmp_path / f"kb11_traces.{rules.FILETYPE}"
+    area_path = tmp_path / f"kb11_area.{rules.FILETYPE}"
+    utils.write_geodata(gdf=tests.kb11_traces_cut, path=traces_path)
+    utils.write_geodata(gdf=tests.kb11_area, path=area_path)
+    invalids = [
+        utils.TraceTuple(
+            traces_path=traces_path,
+            area_path=area_path,
+            validity=rules.ValidationResults.INVALID.value,
+        )
+    ]
+    cache_path = tmp_path / rules.PathNames.VALIDATION_CACHE.value
+
+    result = spatial.validate_invalids_cached(invalids, cache_path=cache_path)
+    assert len(result) == 1
+    assert not result[0].error
+    assert cache_path.exists()
+
+    # Unchanged files are not validated again
+    def no_validation(invalids, max_workers=None):
+        assert len(invalids) == 0
+        return []
+
+    monkeypatch.setattr(spatial, "validate_invalids", no_validation)
+    cached_result = spatial.validate_invalids_cached(invalids, cache_path=cache_path)
+    assert cached_result == result
+
+    # Changed files are validated again
+    utils.write_geodata(gdf=tests.kb11_traces_cut.iloc[:-1], path=traces_path)
+    with pytest.raises(AssertionError):
+        spatial.validate_invalids_cached(invalids, cache_path=cache_path)
+
+
 @pytest.mark.parametrize(
     "update_tuples,invalids", tests.test_sort_update_tuples_to_match_invalids_params()
 )
@@ -129,3 +166,21 @@ def test_sort_update_tuples_to_match_invalids(
         [ut.area_name for ut in result], [iv.area_path.stem for iv in invalids]
     ):
         assert name_in_updated == name_in_invalids
+
+
+@pytest.mark.parametrize("invalids,assume_length", tests.test_unique_invalids_params())
+def test_unique_invalids(invalids, assume_length):
+    """
+    Test unique_invalids.
+    """
+    result = spatial.unique_invalids(invalids)
+
+    assert len(result) == assume_length
+    assert len({invalid.traces_path for invalid in result}) == assume_length
+
+    # First occurrence of each traces_path is kept in input order
+    assert result == [
+        invalid
+        for idx, invalid in enumerate(invalids)
+        if invalid.traces_path not in {other.traces_path for other in invalids[:idx]}
+    ]
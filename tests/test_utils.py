@@ -5,6 +5,7 @@ Tests for utils.py.
 import time
 from pathlib import Path
 
+import geopandas as gpd
 import pandas as pd
 import pytest
 from pandera.errors import SchemaError
@@ -28,6 +29,17 @@ def test_write_geodata(gdf, assume_error, tmp_path):
         assert assume_error
 
 
+@pytest.mark.parametrize("path", [tests.kb11_traces_path, tests.kb11_area_path])
+def test_read_geofile(path):
+    """
+    Test read_geofile.
+    """
+    result = utils.read_geofile(path)
+
+    assert isinstance(result, gpd.GeoDataFrame)
+    assert not result.empty
+
+
 @pytest.mark.parametrize("path, rename_to", tests.test_rename_data_path_params())
 def test_rename_data_path(path, rename_to):
     """
@@ -38,7 +50,7 @@ def test_rename_data_path(path, rename_to):
     assert isinstance(result, Path)
 
     assert rename_to in str(result)
-    assert rename_to in str(list(result.parents)[0])
+    assert rename_to in str(result.parent)
 
 
 @pytest.mark.parametrize("driver", tests.test_compile_export_dir_params())
@@ -54,13 +66,14 @@ def test_compile_export_dir(driver):
     assert " " not in result
 
 
+@pytest.mark.parametrize("fast", [False, True])
 @pytest.mark.parametrize("traces,will_fail", tests.test_perform_pandera_check_params())
-def test_perform_pandera_check(traces, will_fail):
+def test_perform_pandera_check(traces, will_fail, fast):
     """
     Test perform_pandera_check.
     """
     pandera_report = utils.perform_pandera_check(
-        traces, metadata=tests.metadata_loaded()
+        traces, metadata=tests.metadata_loaded(), fast=fast
     )
     assert isinstance(pandera_report, pd.DataFrame)
 
@@ -101,6 +114,27 @@ def test_pandera_reporting(update_tuple, empty_dict, empty_df, update_values):
     assert update_values == pandera_update_values
 
 
+def test_pandera_reporting_batch():
+    """
+    Test pandera_reporting_batch.
+    """
+    update_tuples = [param[0] for param in tests.test_pandera_reporting_params()]
+    metadata = tests.metadata_loaded()
+    results = utils.pandera_reporting_batch(
+        update_tuples=update_tuples, metadata=metadata, max_workers=2
+    )
+
+    assert len(results) == len(update_tuples)
+    for update_tuple, (pandera_update_values, pandera_report) in zip(
+        update_tuples, results
+    ):
+        expected_values, expected_report = utils.pandera_reporting(
+            update_tuple=update_tuple, metadata=metadata
+        )
+        assert pandera_update_values == expected_values
+        assert pandera_report.shape == expected_report.shape
+
+
 @pytest.mark.parametrize("invalids", tests.test_create_validation_table_params())
 def test_create_validation_table(invalids):
     """
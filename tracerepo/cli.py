@@ -2,18 +2,31 @@
 Command line api for tracerepo.
 """
 
+import atexit
+import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from shutil import rmtree
-from typing import List, Optional, Sequence
+from threading import Thread
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
 
 import typer
-from json5 import loads
 from rich.console import Console
 from rich.text import Text
 
-from tracerepo import repo, rules, spatial, utils
-from tracerepo.organize import Organizer
+from tracerepo import repo, rules
+
+# spatial, utils and organize import geopandas and fractopo which are slow to
+# import. They are imported within the commands that need them so that e.g.
+# ``tracerepo --help`` and ``tracerepo init`` start fast.
+# pylint: disable=import-outside-toplevel
+if TYPE_CHECKING:
+    from tracerepo.organize import Organizer
 
 app = typer.Typer()
 console = Console()
@@ -60,12 +73,80 @@ def logging_level(level: str):
 #     )
 
 
+@dataclass
+class CliState:
+    """
+    State shared between commands through ``typer.Context.obj``.
+    """
+
+    organizers: Dict[Tuple[Path, Path], "Organizer"] = field(default_factory=dict)
+
+
+@app.callback()
+def setup_context(ctx: typer.Context):
+    """
+    Use tracerepo to manage and validate fracture & lineament trace data.
+    """
+    if ctx.obj is None:
+        ctx.obj = CliState()
+
+
+def get_organizer(
+    ctx: Optional[typer.Context], tracerepository_path: Path, database: Path
+) -> "Organizer":
+    """
+    Get Organizer for database from context or initialize a new one.
+
+    The initialized Organizer is stored in the context for reuse.
+    """
+    from tracerepo.organize import Organizer
+
+    state = ctx.obj if ctx is not None else None
+    key = (tracerepository_path, database)
+    if isinstance(state, CliState) and key in state.organizers:
+        return state.organizers[key]
+
+    organizer = Organizer(
+        tracerepository_path=tracerepository_path,
+        database=repo.read_database_csv_cached(path=database),
+    )
+    if isinstance(state, CliState):
+        state.organizers[key] = organizer
+    return organizer
+
+
 def load_metadata_from_json(metadata_json_path: Path) -> rules.Metadata:
     """
     Load and parse json metadata of trace columns.
+
+    Parsed metadata is cached until the file changes. The returned Metadata
+    is shared between calls and should be treated as read-only.
+    """
+    stat = metadata_json_path.stat()
+    return load_metadata_from_json_stat_keyed(
+        metadata_json_path, stat.st_mtime_ns, stat.st_size
+    )
+
+
+@lru_cache(maxsize=32)
+def load_metadata_from_json_stat_keyed(
+    metadata_json_path: Path, mtime_ns: int, size: int
+) -> rules.Metadata:
+    """
+    Load and parse json metadata cached by path, mtime and size.
+
+    mtime and size are only used as part of the cache key.
     """
     # Load metadata of column restrictions
-    loaded_metadata = loads(metadata_json_path.read_text())
+    raw_metadata = metadata_json_path.read_text()
+    try:
+        # Standard json is parsed much faster with the C accelerated parser
+        loaded_metadata = json.loads(raw_metadata)
+    except json.JSONDecodeError:
+        # Fall back to json5 for e.g. comments and trailing commas
+        from json5 import loads
+
+        loaded_metadata = loads(raw_metadata)
     if not isinstance(loaded_metadata, dict):
         raise TypeError(
             f"Expected {metadata_json_path} to parse as a dict."
@@ -76,6 +157,7 @@ def load_metadata_from_json(metadata_json_path: Path) -> rules.Metadata:
 
 @app.command()
 def validate(
+    ctx: typer.Context,
     tracerepository_path: Path = TRACEREPOSITORY_PATH_OPTION,
     database_name: str = DATABASE_OPTION,
     area_filter: List[str] = DATA_FILTER,
@@ -99,18 +181,47 @@ def validate(
         ),
         # rules.PathNames.METADATA.value, exists=True, dir_okay=False
     ),
+    fast_validate: bool = typer.Option(
+        False,
+        help=(
+            "Check trace column data on a sample first and skip the full check "
+            "if the sample already fails."
+        ),
+    ),
+    checkpoint_every: int = typer.Option(
+        50,
+        help=(
+            "Write database.csv after every given number of validated datasets. "
+            "Zero or less writes only once after all are validated."
+        ),
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        min=1,
+        help="Number of parallel validation jobs. Defaults to the number of CPUs.",
+    ),
+    validation_cache: bool = typer.Option(
+        True,
+        help=(
+            "Reuse previous validation results of trace datasets whose traces "
+            "and area files are unchanged. Results are stored in file in "
+            f"tracerepository_path directory with name: "
+            f"{rules.PathNames.VALIDATION_CACHE.value}."
+        ),
+    ),
 ):
     """
     Validate trace datasets.
 
     Only validates if the dataset has been marked as invalid in database.csv.
     """
+    from tracerepo import spatial, utils
+
     console = Console()
     database = tracerepository_path / database_name
     # Initialize Organizer
-    organizer = Organizer(
-        tracerepository_path=tracerepository_path,
-        database=repo.read_database_csv(path=database),
+    organizer = get_organizer(
+        ctx=ctx, tracerepository_path=tracerepository_path, database=database
     )
 
     # Resolve metadata_json_path
@@ -148,30 +259,53 @@ def validate(
         console.print(utils.create_validation_table(unique_invalids_only))
 
     # Validate the invalids
-    update_tuples = spatial.validate_invalids(invalids=unique_invalids_only)
+    max_workers = jobs if jobs is not None else os.cpu_count()
+    if validation_cache:
+        update_tuples = spatial.validate_invalids_cached(
+            invalids=unique_invalids_only,
+            cache_path=tracerepository_path / rules.PathNames.VALIDATION_CACHE.value,
+            max_workers=max_workers,
+        )
+    else:
+        update_tuples = spatial.validate_invalids(
+            invalids=unique_invalids_only, max_workers=max_workers
+        )
 
     # Exit with error code 1 if there's errors in updating the database.csv
     database_error, write_error = False, False
 
     assert len(update_tuples) == len(unique_invalids_only)
-    # Iterate over results
 
-    for update_tuple, invalid in zip(update_tuples, unique_invalids_only):
-        # Validate and gather pandera reporting
-        pandera_update_values, pandera_report = utils.pandera_reporting(
-            update_tuple=update_tuple,
-            metadata=metadata,
-        )
+    # Updates to the Organizer database are applied in batches
+    pending_updates: List[Tuple[str, Dict[rules.ColumnNames, str]]] = []
+
+    # Pandera report descriptions are printed once after the loop
+    str_reports: List[str] = []
+
+    # Resolve area names once before iterating
+    area_names = [invalid.area_path.stem for invalid in unique_invalids_only]
+
+    # Validate and gather pandera reporting
+    pandera_results = utils.pandera_reporting_batch(
+        update_tuples=update_tuples,
+        metadata=metadata,
+        fast=fast_validate,
+        max_workers=max_workers,
+    )
+
+    # Iterate over results
+    for idx, (
+        update_tuple,
+        area_name,
+        (pandera_update_values, pandera_report),
+    ) in enumerate(zip(update_tuples, area_names, pandera_results), start=1):
 
         # If the geodataset is otherwise valid but fails pandera checks it will
         # be marked as unfit
         if len(pandera_update_values) > 0:
             update_tuple.update_values = pandera_update_values
-        # Update Organizer database.csv
-        organizer.update(
-            area_name=invalid.area_path.stem,
-            update_values=update_tuple.update_values,
-        )
+        # Collect the update to be applied to the Organizer database
+        pending_updates.append((area_name, update_tuple.update_values))
 
         if not pandera_report.empty and report:
             report_directory = (
@@ -185,21 +319,24 @@ def validate(
                 area_name=update_tuple.area_name,
                 traces_name=update_tuple.traces_path.stem,
             )
-            console.print(str_report)
-    try:
-        # Write the database.csv
-        repo.write_database_csv(path=database, database=organizer.database)
+            str_reports.append(str_report)
 
-    except Exception:
-        # Error in updating or writing database.csv
-        database_error = True
+        # Checkpoint the database.csv so that progress is not lost if
+        # the validation of a later dataset crashes
+        if checkpoint_every > 0 and idx % checkpoint_every == 0:
+            organizer.update_many(updates=pending_updates)
+            pending_updates = []
+            if not write_database_csv_logged(path=database, organizer=organizer):
+                write_error = True
 
-        # Log exception
-        logging.error(
-            "Error when updating or writing Organizer database.csv. "
-            f"{dict(database=organizer.database, path=database)}",
-            exc_info=True,
-        )
+    # Update Organizer database and write the database.csv once after all
+    # updates
+    organizer.update_many(updates=pending_updates)
+    if not write_database_csv_logged(path=database, organizer=organizer):
+        write_error = True
+
+    if len(str_reports) > 0:
+        console.print("\n".join(str_reports))
 
     # Report validation results with a rich.table.Table
     if report:
@@ -214,8 +351,29 @@ def validate(
         raise typer.Exit(code=1)
 
 
+def write_database_csv_logged(path: Path, organizer: "Organizer") -> bool:
+    """
+    Write Organizer database to path and log possible errors.
+
+    Returns True if writing was successful.
+    """
+    try:
+        # Write the database.csv
+        repo.write_database_csv(path=path, database=organizer.database)
+    except Exception:
+        # Log exception
+        logging.error(
+            "Error when updating or writing Organizer database.csv. "
+            f"{dict(database=organizer.database, path=path)}",
+            exc_info=True,
+        )
+        return False
+    return True
+
+
 @app.command()
 def format_geojson(
+    ctx: typer.Context,
     tracerepository_path: Path = TRACEREPOSITORY_PATH_OPTION,
     database_name: str = DATABASE_OPTION,
 ):
@@ -223,44 +381,73 @@ def format_geojson(
     Format all dataset GeoJSON from cli.
     """
     database = tracerepository_path / database_name
-    format_repo_geojson(database=database, tracerepository_path=tracerepository_path)
+    format_repo_geojson(
+        database=database,
+        tracerepository_path=tracerepository_path,
+        organizer=get_organizer(
+            ctx=ctx, tracerepository_path=tracerepository_path, database=database
+        ),
+    )
 
 
-def format_repo_geojson(tracerepository_path: Path, database: Path):
+def format_repo_geojson(
+    tracerepository_path: Path,
+    database: Path,
+    organizer: Optional["Organizer"] = None,
+):
     """
     Format all dataset GeoJSON.
+
+    An already initialized ``organizer`` can be given to avoid re-reading
+    the database.
     """
     # Initialize Organizer
-    organizer = Organizer(
-        tracerepository_path=tracerepository_path,
-        database=repo.read_database_csv(path=database),
-    )
+    if organizer is None:
+        organizer = get_organizer(
+            ctx=None, tracerepository_path=tracerepository_path, database=database
+        )
 
     # Query for invalid traces
     trace_tuples = organizer.query()
 
     # Do not load and save same paths multiple times
-    formatted_paths = set()
-
-    # Iterate over all area trace tuples
-
-    for trace_tuple in trace_tuples:
-        for path in (trace_tuple.traces_path, trace_tuple.area_path):
-            if path in formatted_paths:
-                continue
-
-            # Read GeoDataFrame
-            gdf = spatial.read_geofile(path)
+    # Deduplicate with str keys which hash faster than Path objects
+    unique_paths: Dict[str, Path] = {
+        os.fspath(path): path
+        for trace_tuple in trace_tuples
+        for path in (trace_tuple.traces_path, trace_tuple.area_path)
+    }
+    paths_to_format = list(unique_paths.values())
+
+    if len(paths_to_format) == 0:
+        return
+
+    # Each file is read and written independently so the work is split
+    # between threads. Reading and writing with GDAL releases the GIL and
+    # threads avoid re-importing geopandas in worker processes.
+    max_workers = min(32, len(paths_to_format))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the iterator to raise possible exceptions from workers
+        for _ in executor.map(format_geojson_path, paths_to_format):
+            pass
+
+
+def format_geojson_path(path: Path):
+    """
+    Format a single GeoJSON file in place.
+    """
+    from tracerepo import spatial, utils
 
-            # Write as GeoJSON
-            utils.write_geodata(gdf=gdf, path=path)
+    # Read GeoDataFrame
+    gdf = spatial.read_geofile(path)
 
-            # Add formatted paths
-            formatted_paths.add(path)
+    # Write as GeoJSON
+    utils.write_geodata(gdf=gdf, path=path)
 
 
 @app.command()
 def organize(
+    ctx: typer.Context,
     tracerepository_path: Path = TRACEREPOSITORY_PATH_OPTION,
     database_name: str = DATABASE_OPTION,
     simulate: bool = typer.Option(False),
@@ -270,9 +457,8 @@ def organize(
     Organize repo.
     """
     database = tracerepository_path / database_name
-    organizer = Organizer(
-        tracerepository_path=tracerepository_path,
-        database=repo.read_database_csv(path=database),
+    organizer = get_organizer(
+        ctx=ctx, tracerepository_path=tracerepository_path, database=database
     )
 
     move_descriptions = organizer.organize(simulate=simulate)
@@ -286,6 +472,7 @@ def organize(
 
 @app.command()
 def check(
+    ctx: typer.Context,
     tracerepository_path: Path = TRACEREPOSITORY_PATH_OPTION,
     database_name: str = DATABASE_OPTION,
 ):
@@ -293,9 +480,8 @@ def check(
     Check repo.
     """
     database = tracerepository_path / database_name
-    organizer = Organizer(
-        tracerepository_path=tracerepository_path,
-        database=repo.read_database_csv(path=database),
+    organizer = get_organizer(
+        ctx=ctx, tracerepository_path=tracerepository_path, database=database
     )
 
     organizer.check()
@@ -323,16 +509,22 @@ def export_data(
     traces_filter: Sequence[str] = (),
     scale_filter: Sequence[str] = (),
     overwrite: bool = True,
+    organizer: Optional["Organizer"] = None,
 ) -> Path:
     """
     Export datasets into another format.
+
+    An already initialized ``organizer`` can be given to avoid re-reading
+    the database.
     """
+    from tracerepo import spatial, utils
+
     assert destination.is_dir()
     # Initialize Organizer
-    organizer = Organizer(
-        tracerepository_path=tracerepository_path,
-        database=repo.read_database_csv(path=database),
-    )
+    if organizer is None:
+        organizer = get_organizer(
+            ctx=None, tracerepository_path=tracerepository_path, database=database
+        )
 
     # Query for datasets based on filters
     # By default filters are empty i.e. all are selected
@@ -347,19 +539,16 @@ def export_data(
     export_destination_dir = utils.compile_export_dir(driver)
     export_destination_path = destination / export_destination_dir
 
-    # Does destination already exist
-    destination_exists = export_destination_path.exists()
-
-    if destination_exists and overwrite:
-        logging.info(f"Removing directory ({export_destination_path}) recursively.")
-        rmtree(export_destination_path)
-
-    elif destination_exists:
+    if not overwrite and os.path.lexists(export_destination_path):
         raise FileExistsError(
             f"Directory already exists at {export_destination_path} "
             "and overwrite is not allowed (--no-overwrite given)."
         )
 
+    # Remove existing export directory without checking for it first
+    with suppress(FileNotFoundError):
+        remove_directory_in_background(export_destination_path)
+
     # Compile from trace tuples into paths
     dest_trace_tuples = spatial.convert_trace_tuples(
         trace_tuples, export_destination=export_destination_dir, driver=driver
@@ -376,8 +565,35 @@ def export_data(
     return export_destination_path
 
 
+def remove_directory_in_background(path: Path) -> Optional[Thread]:
+    """
+    Remove directory recursively in a background thread.
+
+    The directory is first renamed aside so that ``path`` is free to be
+    written to immediately. Falls back to removing in place if renaming
+    fails e.g. due to permissions. Returns the removing thread if started.
+    """
+    removed_path = path.with_name(f".{path.name}.old.{os.getpid()}")
+    try:
+        path.rename(removed_path)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        logging.info(f"Removing directory ({path}) recursively.")
+        rmtree(path)
+        return None
+
+    logging.info(f"Removing directory ({removed_path}) recursively in background.")
+    thread = Thread(target=rmtree, args=(removed_path,), daemon=True)
+    thread.start()
+    # Make sure the removal finishes before the interpreter exits
+    atexit.register(thread.join)
+    return thread
+
+
 @app.command()
 def export(
+    ctx: typer.Context,
     destination: Path = typer.Argument(".", file_okay=False),
     driver: str = typer.Option("ESRI Shapefile"),
     tracerepository_path: Path = TRACEREPOSITORY_PATH_OPTION,
@@ -393,6 +609,9 @@ def export(
     """
     database = tracerepository_path / database_name
     export_destination = export_data(
+        organizer=get_organizer(
+            ctx=ctx, tracerepository_path=tracerepository_path, database=database
+        ),
         tracerepository_path=tracerepository_path,
         destination=destination,
         driver=driver,
@@ -2,12 +2,12 @@
 Organize trace data.
 """
 
-from dataclasses import dataclass
-from itertools import compress
+from dataclasses import dataclass, field
 from pathlib import Path
 from shutil import move
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 from tracerepo import rules, utils
@@ -23,6 +23,9 @@ class Organizer:
     tracerepository_path: Path
 
     _columns: Optional[Dict[str, List[Any]]] = None
+    _query_cache: Dict[Tuple[Tuple[str, ...], ...], List[utils.TraceTuple]] = field(
+        default_factory=dict
+    )
 
     def __post_init__(self):
         """
@@ -160,17 +163,27 @@ class Organizer:
     ) -> Sequence[bool]:
         """
         Filter database traces and areas based on given strings.
+
+        A value is accepted if any of the filter strings is contained in it.
         """
+        query_mask = np.array(query_bools, dtype=bool)
         for filterer, list_to_filter in zip(
             (area, traces, thematic, scale),
             (area_values, traces_values, thematic_values, scale_values),
         ):
-            filtered = utils.multi_string_filter(
-                strings=filterer, list_to_filter=list_to_filter
-            )
+            # No filtering i.e. all accepted
+            if len(filterer) == 0:
+                continue
+
+            values = pd.Series(list_to_filter, dtype=str)
+            filtered = np.zeros(len(values), dtype=bool)
+            for string in filterer:
+                filtered |= values.str.contains(string, regex=False).to_numpy(
+                    dtype=bool
+                )
 
-            query_bools = utils.join_bools(filtered, query_bools)
-        return query_bools
+            query_mask &= filtered
+        return query_mask.tolist()
 
     @staticmethod
     def _filter_enums(
@@ -183,6 +196,7 @@ class Organizer:
         """
         Filter database traces and areas based on given enum choices.
         """
+        query_mask = np.array(query_bools, dtype=bool)
         for filterer, list_to_filter in zip(
             (area_shape, validity),
             (
@@ -194,25 +208,16 @@ class Organizer:
             if filterer is None or len(filterer) == 0:
                 continue
 
-            assert isinstance(filterer, Sequence)
             assert None not in filterer
-            # filterer_vals = [filterer_val.value for filterer_val in filterer]
-            # boolean = lambda val: val in filterer_vals or len(filterer_vals) == 0
-            # else:
-            # boolean = lambda val: val == filterer.value
 
             filterer_value_set = set(filt.value for filt in filterer)
 
-            query_bools = [
-                all(
-                    (
-                        val in filterer_value_set,
-                        query_bool_val,
-                    )
-                )
-                for val, query_bool_val in zip(list_to_filter, query_bools)
-            ]
-        return query_bools
+            query_mask &= (
+                pd.Series(list_to_filter, dtype=str)
+                .isin(filterer_value_set)
+                .to_numpy(dtype=bool)
+            )
+        return query_mask.tolist()
 
     def query(
         self,
@@ -225,16 +230,54 @@ class Organizer:
     ) -> List[utils.TraceTuple]:
         """
         Query for trace and area data.
+
+        Results are cached by the filters until the database is updated.
+        """
+        query_key = (
+            tuple(sorted(area)),
+            tuple(sorted(traces)),
+            tuple(sorted(thematic)),
+            tuple(sorted(scale)),
+            tuple(sorted(filt.value for filt in area_shape)),
+            tuple(sorted(filt.value for filt in validity)),
+        )
+        if query_key not in self._query_cache:
+            self._query_cache[query_key] = self._query_database(
+                area=area,
+                traces=traces,
+                thematic=thematic,
+                scale=scale,
+                area_shape=area_shape,
+                validity=validity,
+            )
+
+        # Return a copy so that the cached list cannot be mutated
+        return list(self._query_cache[query_key])
+
+    def _query_database(
+        self,
+        area: Sequence[str],
+        traces: Sequence[str],
+        thematic: Sequence[str],
+        scale: Sequence[str],
+        area_shape: Sequence[rules.AreaShapes],
+        validity: Sequence[rules.ValidationResults],
+    ) -> List[utils.TraceTuple]:
+        """
+        Query for trace and area data from database.
         """
+        database = self.database
+        area_values = database.index
+
         # default value, all accepted
-        query_bools = [True] * len(self.columns[rules.ColumnNames.AREA.value])
+        query_bools: Sequence[bool] = [True] * database.shape[0]
 
         # Check area, traces, thematic and scale filters
         query_bools = self._filter_strings(
-            area_values=self.columns[rules.ColumnNames.AREA.value],
-            traces_values=self.columns[rules.ColumnNames.TRACES.value],
-            thematic_values=self.columns[rules.ColumnNames.THEMATIC.value],
-            scale_values=self.columns[rules.ColumnNames.SCALE.value],
+            area_values=area_values,
+            traces_values=database[rules.ColumnNames.TRACES.value],
+            thematic_values=database[rules.ColumnNames.THEMATIC.value],
+            scale_values=database[rules.ColumnNames.SCALE.value],
             query_bools=query_bools,
             area=area,
             traces=traces,
@@ -249,8 +292,8 @@ class Organizer:
         # Check area_shape, empty and validated filters
         query_bools = self._filter_enums(
             query_bools=query_bools,
-            area_shape_values=self.columns[rules.ColumnNames.AREA_SHAPE.value],
-            validity_values=self.columns[rules.ColumnNames.VALIDITY.value],
+            area_shape_values=database[rules.ColumnNames.AREA_SHAPE.value],
+            validity_values=database[rules.ColumnNames.VALIDITY.value],
             area_shape=area_shape,
             validity=validity,
         )
@@ -259,30 +302,18 @@ class Organizer:
         if not any(query_bools):
             return []
 
-        # Collect the columns that are needed for path solving
-        columns_needed = [
-            rules.ColumnNames.THEMATIC.value,
-            rules.ColumnNames.SCALE.value,
-            rules.ColumnNames.TRACES.value,
-            rules.ColumnNames.AREA.value,
-            rules.ColumnNames.SNAP_THRESHOLD.value,
-            rules.ColumnNames.VALIDITY.value,
+        # Select the accepted rows and needed columns with a boolean mask
+        selected = database.loc[
+            np.array(query_bools, dtype=bool),
+            [
+                rules.ColumnNames.THEMATIC.value,
+                rules.ColumnNames.SCALE.value,
+                rules.ColumnNames.TRACES.value,
+                rules.ColumnNames.SNAP_THRESHOLD.value,
+                rules.ColumnNames.VALIDITY.value,
+            ],
         ]
 
-        # Compress the values corresponding to columns_needed based on
-        # query_bools boolean list
-        (
-            thematic_vals,
-            scale_vals,
-            trace_vals,
-            area_vals,
-            snap_vals,
-            validity_vals,
-        ) = tuple(
-            list(compress(data=self.columns[col], selectors=query_bools))
-            for col in columns_needed
-        )
-
         # Collect trace and area paths (both or one of depending on geometry
         # filter) into named tuples.
         paths: List[utils.TraceTuple] = [
@@ -296,20 +327,13 @@ class Organizer:
                 validity_val=validity_val,
             )
             for (
+                area_val,
                 thematic_val,
                 scale_val,
                 traces_val,
-                area_val,
                 snap_val,
                 validity_val,
-            ) in zip(
-                thematic_vals,
-                scale_vals,
-                trace_vals,
-                area_vals,
-                snap_vals,
-                validity_vals,
-            )
+            ) in selected.itertuples(index=True, name=None)
         ]
 
         return paths
@@ -318,28 +342,45 @@ class Organizer:
         """
         Change a value in the database.
         """
-        # Get index for area_name
-        index_for_area = self.columns[rules.ColumnNames.AREA.value].index(area_name)
+        self.update_many(updates=[(area_name, update_values)])
+
+    def update_many(self, updates: Sequence[Tuple[str, Dict[rules.ColumnNames, str]]]):
+        """
+        Change values of multiple areas in the database in one pass.
+
+        ``updates`` consists of area name and update values pairs.
+        """
+        if len(updates) == 0:
+            return
+
+        # Group the new values by column
+        column_updates: Dict[str, Dict[str, str]] = dict()
+        for area_name, update_values in updates:
+            for key, value in update_values.items():
+                column_updates.setdefault(key.value, dict())[area_name] = value
 
-        # Iterate over keys in update_values dict
-        for key in update_values:
-            # Get the current values
-            column_values = self.columns[key.value]
+        # Make copy of instance dataframe
+        database = self.database.copy()
+        area_names = database.index
 
-            # Update value at index
-            column_values[index_for_area] = update_values[key]
+        for column, area_values in column_updates.items():
+            # Make sure all updated areas are in the database
+            missing = set(area_values).difference(area_names)
+            if len(missing) > 0:
+                raise ValueError(f"Expected areas {missing} to be in database.")
 
-            # Make copy of instance dataframe
-            database = self.database.copy()
+            # Update column in dataframe with updated values
+            mask = area_names.isin(list(area_values))
+            database.loc[mask, column] = area_names[mask].map(area_values).to_numpy()
 
-            # Update column in dataframe with updated value
-            database[key.value] = column_values
+        # Validate
+        database = rules.database_schema().validate(database)
 
-            # Validate
-            database = rules.database_schema().validate(database)
+        # Set new database
+        self.database = database
 
-            # Set new database
-            self.database = database
+        # Reset columns cached property
+        self._columns = None
 
-            # Reset columns cached property
-            self._columns = None
+        # Reset cached query results
+        self._query_cache = dict()
@@ -2,24 +2,47 @@
 Main repo handlers.
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 import pandas as pd
 
 from tracerepo import rules
 
+DATABASE_CSV_BUFFER_SIZE = 1 << 20
+
 
 def write_database_csv(path: Path, database: pd.DataFrame):
     """
     Write database.csv to disk.
+
+    The database is first written to a temporary file next to ``path`` which
+    then replaces ``path`` atomically. Databases cached by
+    ``read_database_csv_cached`` are invalidated.
     """
     database = rules.database_schema().validate(database)
-    database.to_csv(
-        path_or_buf=path,
-        sep=rules.DATABASE_CSV_SEP,
-        index=True,
-        index_label=rules.ColumnNames.AREA.value,
-    )
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    # Write through a large binary buffer with explicit line terminators to
+    # skip text mode newline translation
+    try:
+        with open(tmp_path, mode="wb", buffering=DATABASE_CSV_BUFFER_SIZE) as handle:
+            database.to_csv(
+                path_or_buf=handle,
+                sep=rules.DATABASE_CSV_SEP,
+                index=True,
+                index_label=rules.ColumnNames.AREA.value,
+                lineterminator="\n",
+                chunksize=10_000,
+            )
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Do not leave a partially written temporary file behind
+        tmp_path.unlink(missing_ok=True)
+        raise
+    # A rewrite within the mtime resolution of the filesystem could keep the
+    # same cache key so drop cached databases explicitly
+    _read_database_csv_stat_keyed.cache_clear()
 
 
 def read_database_csv(path: Path) -> pd.DataFrame:
@@ -32,6 +55,31 @@ def read_database_csv(path: Path) -> pd.DataFrame:
     return csv
 
 
+@lru_cache(maxsize=8)
+def _read_database_csv_stat_keyed(
+    resolved_path: str, mtime_ns: int, size: int
+) -> pd.DataFrame:
+    """
+    Read database csv cached by its resolved path, mtime and size.
+
+    mtime and size are only used as part of the cache key.
+    """
+    return read_database_csv(path=Path(resolved_path))
+
+
+def read_database_csv_cached(path: Path) -> pd.DataFrame:
+    """
+    Read database csv or get it from cache if the file has not changed.
+
+    A copy is returned so that the cached database cannot be mutated.
+    """
+    stat = path.stat()
+    database = _read_database_csv_stat_keyed(
+        str(path.resolve()), stat.st_mtime_ns, stat.st_size
+    )
+    return database.copy()
+
+
 def scaffold_database():
     """
     Make scaffold database.
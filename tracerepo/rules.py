@@ -72,6 +72,7 @@ class PathNames(Enum):
     REPORTS = "tracerepository_reports"
     METADATA = "metadata_rules.json"
     DATABASE_CSV = "database.csv"
+    VALIDATION_CACHE = ".tracerepo_cache.json"
 
 
 @unique
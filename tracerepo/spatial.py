@@ -2,15 +2,18 @@
 Spatial data validation.
 """
 
+import json
 import logging
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from itertools import groupby
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+from itertools import chain
 from pathlib import Path
-from typing import List, Sequence, Tuple, Type, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Type, Union
 
 import geopandas as gpd
 import numpy as np
-from fractopo.general import is_empty_area, read_geofile
+from fractopo.general import is_empty_area
 from fractopo.tval.trace_validation import Validation
 from fractopo.tval.trace_validators import (
     ALL_VALIDATORS,
@@ -21,7 +24,7 @@ from fractopo.tval.trace_validators import (
 
 from tracerepo import rules, utils
 from tracerepo.rules import ValidationResults
-from tracerepo.utils import TraceTuple
+from tracerepo.utils import TraceTuple, read_geofile
 
 ANY_VALIDATOR = Union[Type[BaseValidator], Type[EmptyTargetAreaValidator]]
 
@@ -98,21 +101,15 @@ def validate(
 def unique_invalids(invalids: List[utils.TraceTuple]) -> List[utils.TraceTuple]:
     """
     Return invalids that are unique by traces_path.
-    """
-
-    def keyfunc(invalid: utils.TraceTuple) -> Path:
-        """
-        Return traces_path from invalid.
-        """
-        traces_path = invalid.traces_path
-        assert isinstance(traces_path, Path)
-        return traces_path
 
-    unique = []
-    sorted_invalids = sorted(invalids, key=keyfunc)
-    for _, group in groupby(sorted_invalids, key=keyfunc):
-        unique.append(next(group))
-    return unique
+    The first invalid of each traces_path is kept and the input order is
+    preserved.
+    """
+    unique: Dict[Path, utils.TraceTuple] = {}
+    for invalid in invalids:
+        assert isinstance(invalid.traces_path, Path)
+        unique.setdefault(invalid.traces_path, invalid)
+    return list(unique.values())
 
 
 def sort_update_tuples_to_match_invalids(
@@ -139,52 +136,162 @@ def sort_update_tuples_to_match_invalids(
     return sorted_update_tuples
 
 
-def validate_invalids(invalids: Sequence[utils.TraceTuple]) -> List[utils.UpdateTuple]:
+def validate_invalids(
+    invalids: Sequence[utils.TraceTuple], max_workers: Optional[int] = None
+) -> List[utils.UpdateTuple]:
     """
     Validate a sequence of invalids with multiprocessing support.
 
-    Will not validate the same trace dataset twice.
+    Will not validate the same trace dataset twice. The returned update
+    tuples are in the same order as ``invalids``.
     """
-    # Collect validated
-    update_tuples: List[utils.UpdateTuple] = []
+    if len(invalids) == 0:
+        return []
 
     # multiprocessing!
-    with ProcessPoolExecutor() as executor:
-        # Iterate over invalids. submit as tasks
-        futures = {
-            executor.submit(validate_invalid, invalid): invalid for invalid in invalids
-        }
+    # executor.map keeps the submitted order
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        update_tuples = list(
+            executor.map(validate_invalid_or_critical, invalids, chunksize=2)
+        )
+    return update_tuples
 
-        # Collect all tasks as they complete
-        # Will not be in same order submitted!?
-        for future in as_completed(futures):
-            # If validation critically fails for a dataset
-            # we can still proceed with other validations
-            try:
-                # Get result from Future
-                # This will throw an error (if it happened in process)
-                update_tuple = future.result()
-            except Exception:
-                # Catch and log critical failures
-                logging.error(
-                    f"Validation exception with {futures[future]}.",
-                    exc_info=True,
-                )
-                update_values = {
-                    rules.ColumnNames.VALIDITY: rules.ValidationResults.CRITICAL.value
-                }
-                update_tuple = utils.UpdateTuple(
-                    area_name=futures[future].area_path.stem,
-                    update_values=update_values,
-                    error=True,
-                    traces_path=futures[future].traces_path,
-                )
-            # Collect result
-            update_tuples.append(update_tuple)
-    return sort_update_tuples_to_match_invalids(
-        update_tuples=update_tuples, invalids=invalids
+
+def validation_signature(invalid: utils.TraceTuple) -> List[Union[int, float]]:
+    """
+    Return the file signature the validation result of invalid depends on.
+
+    Consists of the mtime and size of both traces and area files and the
+    snap threshold.
+    """
+    traces_stat = invalid.traces_path.stat()
+    area_stat = invalid.area_path.stat()
+    return [
+        traces_stat.st_mtime_ns,
+        traces_stat.st_size,
+        area_stat.st_mtime_ns,
+        area_stat.st_size,
+        invalid.snap_threshold,
+    ]
+
+
+def read_validation_cache(path: Path) -> Dict[str, dict]:
+    """
+    Read validation cache json.
+
+    A missing or corrupted cache is treated as empty.
+    """
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return dict()
+    return cache if isinstance(cache, dict) else dict()
+
+
+def write_validation_cache(path: Path, cache: Dict[str, dict]):
+    """
+    Write validation cache json.
+    """
+    try:
+        path.write_text(json.dumps(cache, indent=1, sort_keys=True), encoding="utf-8")
+    except OSError:
+        # The cache is only an optimization
+        logging.warning(f"Could not write validation cache to {path}.", exc_info=True)
+
+
+def validate_invalids_cached(
+    invalids: Sequence[utils.TraceTuple],
+    cache_path: Path,
+    max_workers: Optional[int] = None,
+) -> List[utils.UpdateTuple]:
+    """
+    Validate a sequence of invalids skipping datasets unchanged since last run.
+
+    Results of previous validations are stored in the json at ``cache_path``
+    keyed by traces path with the ``validation_signature`` of the files. The
+    returned update tuples are in the same order as ``invalids``.
+    """
+    cache = read_validation_cache(cache_path)
+
+    def cache_key(invalid: utils.TraceTuple) -> str:
+        """
+        Return resolved traces_path from invalid.
+        """
+        return os.fspath(invalid.traces_path.resolve())
+
+    # Partition invalids by whether their files have changed
+    cached: Dict[int, utils.UpdateTuple] = dict()
+    stale: List[Tuple[int, utils.TraceTuple]] = []
+    for idx, invalid in enumerate(invalids):
+        entry = cache.get(cache_key(invalid))
+        try:
+            signature = validation_signature(invalid)
+        except OSError:
+            # Missing files are left for validation to report
+            signature = None
+        if (
+            isinstance(entry, dict)
+            and signature is not None
+            and entry.get("signature") == signature
+        ):
+            cached[idx] = utils.UpdateTuple(
+                area_name=invalid.area_path.stem,
+                update_values={rules.ColumnNames.VALIDITY: entry["validity"]},
+                traces_path=invalid.traces_path,
+            )
+        else:
+            stale.append((idx, invalid))
+
+    validated = validate_invalids(
+        invalids=[invalid for _, invalid in stale], max_workers=max_workers
     )
 
+    # Store results of successful validations with the signature of the
+    # files after validation as validation rewrites the traces
+    for (idx, invalid), update_tuple in zip(stale, validated):
+        cached[idx] = update_tuple
+        validity = update_tuple.update_values[rules.ColumnNames.VALIDITY]
+        # Critical failures might be transient so they are not cached
+        if update_tuple.error or validity == ValidationResults.CRITICAL.value:
+            cache.pop(cache_key(invalid), None)
+            continue
+        try:
+            signature = validation_signature(invalid)
+        except OSError:
+            continue
+        cache[cache_key(invalid)] = dict(signature=signature, validity=validity)
+
+    if len(stale) > 0:
+        write_validation_cache(cache_path, cache)
+
+    return [cached[idx] for idx in range(len(invalids))]
+
+
+def validate_invalid_or_critical(invalid: utils.TraceTuple) -> utils.UpdateTuple:
+    """
+    Validate a given trace dataset and mark critical failures.
+
+    If validation critically fails for a dataset we can still proceed with
+    other validations.
+    """
+    try:
+        return validate_invalid(invalid)
+    except Exception:
+        # Catch and log critical failures
+        logging.error(
+            f"Validation exception with {invalid}.",
+            exc_info=True,
+        )
+        update_values = {
+            rules.ColumnNames.VALIDITY: rules.ValidationResults.CRITICAL.value
+        }
+        return utils.UpdateTuple(
+            area_name=invalid.area_path.stem,
+            update_values=update_values,
+            error=True,
+            traces_path=invalid.traces_path,
+        )
+
 
 def validate_invalid(invalid: utils.TraceTuple) -> utils.UpdateTuple:
     """
@@ -308,17 +415,27 @@ def convert_trace_tuples(
      PosixPath('exported'),
      PosixPath('.')]
     """
-    convert_paths: List[TraceTuple] = []
-    # Iterate over datasets and save
-    trace_tuple: TraceTuple
-    for trace_tuple in trace_tuples:
-        convert_paths.append(
-            rename_trace_tuple_paths(
-                trace_tuple=trace_tuple,
-                export_destination=export_destination,
-                driver=driver,
-            )
+    # Rename each unique path only once as trace datasets are often shared
+    # between multiple areas
+    unique_paths = dict.fromkeys(
+        chain.from_iterable(
+            (trace_tuple.traces_path, trace_tuple.area_path)
+            for trace_tuple in trace_tuples
         )
+    )
+    renamed_paths = {
+        path: rename_path(path, export_destination, driver) for path in unique_paths
+    }
+
+    convert_paths: List[TraceTuple] = [
+        TraceTuple(
+            traces_path=renamed_paths[trace_tuple.traces_path],
+            area_path=renamed_paths[trace_tuple.area_path],
+            snap_threshold=trace_tuple.snap_threshold,
+            validity=trace_tuple.validity,
+        )
+        for trace_tuple in trace_tuples
+    ]
 
     return convert_paths
 
@@ -331,13 +448,33 @@ def save_converted_paths(
 ):
     """
     Save transformed geodata files to new paths.
+
+    Datasets are written concurrently in threads as GDAL releases the GIL
+    during writes.
     """
+    # Collect unique conversions so that the same trace dataset, shared by
+    # multiple areas, is not written by two threads at once
+    conversions: Dict[Path, Path] = dict()
     for src_trace_tuple, dest_trace_tuple in zip(src_trace_tuples, dest_trace_tuples):
         for original_path, convert_path in zip(
             (src_trace_tuple.traces_path, src_trace_tuple.area_path),
             (dest_trace_tuple.traces_path, dest_trace_tuple.area_path),
         ):
-            convert_filetype(original_path, destination / convert_path, driver=driver)
+            conversions.setdefault(destination / convert_path, original_path)
+
+    if len(conversions) == 0:
+        return
+
+    max_workers = min(os.cpu_count() or 1, len(conversions))
+    convert = partial(convert_filetype, driver=driver)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(convert, original_path, convert_path)
+            for convert_path, original_path in conversions.items()
+        ]
+        for future in as_completed(futures):
+            # Raise possible exceptions from threads
+            future.result()
 
 
 def convert_filetype(original_path: Path, convert_path: Path, driver: str):
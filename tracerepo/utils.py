@@ -4,16 +4,18 @@ General utilities.
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type
 
 import geopandas as gpd
 import pandas as pd
 import pandera as pa
-from fractopo import general
 from rich.table import Table
 from rich.text import Text
 
@@ -21,6 +23,15 @@ from tracerepo import rules, trace_schema
 
 GEOJSON_DRIVER = "GeoJSON"
 EXPORT_DIR_PREFIX = "data-exported-"
+PANDERA_SAMPLE_SIZE = 1024
+
+# pyogrio reads whole layers in a single vectorized batch and optionally
+# through the Arrow interface if pyarrow is installed
+READ_ENGINE_KWARGS: Dict[str, Any] = (
+    dict(engine="pyogrio", use_arrow=find_spec("pyarrow") is not None)
+    if find_spec("pyogrio") is not None
+    else dict()
+)
 
 
 class TraceTuple(NamedTuple):
@@ -46,6 +57,18 @@ class UpdateTuple:
     error: bool = False
 
 
+def read_geofile(path: Path) -> gpd.GeoDataFrame:
+    """
+    Read a GeoDataFrame from path.
+
+    Uses the pyogrio engine if it is available.
+    """
+    data = gpd.read_file(path, **READ_ENGINE_KWARGS)
+    if not isinstance(data, gpd.GeoDataFrame):
+        raise TypeError("Expected GeoDataFrame as file read result.")
+    return data
+
+
 def dataframe_column_to_python(
     dataframe: pd.DataFrame, column: str, python_type: Type[Any]
 ) -> List[Any]:
@@ -324,15 +347,31 @@ def remove_from_dict_if_in(key: str, dict_to_check: Dict[str, Path]):
 
 
 def perform_pandera_check(
-    traces: gpd.GeoDataFrame, metadata: rules.Metadata
+    traces: gpd.GeoDataFrame, metadata: rules.Metadata, fast: bool = False
 ) -> pd.DataFrame:
     """
     Validate the column data in ``traces`` ``GeoDataFrame``.
+
+    If ``fast`` is True, a sample of the rows is checked first and the full
+    check is skipped if the sample already fails. The report is then only
+    based on the first failure in the sample.
     """
     pandera_report: pd.DataFrame = pd.DataFrame()
     assert pandera_report.empty
+    schema = trace_schema.traces_schema(metadata=metadata)
+    if fast:
+        sample = traces.sample(
+            n=min(PANDERA_SAMPLE_SIZE, traces.shape[0]), random_state=0
+        )
+        try:
+            schema.validate(sample, lazy=False)
+        except pa.errors.SchemaError as exc:
+            failure_cases = exc.failure_cases
+            if isinstance(failure_cases, pd.DataFrame) and not failure_cases.empty:
+                return failure_cases
+            return pd.DataFrame({"ERROR": [str(exc)]})
     try:
-        trace_schema.traces_schema(metadata=metadata).validate(traces, lazy=True)
+        schema.validate(traces, lazy=True)
     except pa.errors.SchemaErrors as exc:
         pandera_report = exc.failure_cases
         assert isinstance(pandera_report, pd.DataFrame)
@@ -378,7 +417,7 @@ def otherwise_valid(update_tuple: UpdateTuple) -> bool:
 
 
 def pandera_reporting(
-    update_tuple: UpdateTuple, metadata: rules.Metadata
+    update_tuple: UpdateTuple, metadata: rules.Metadata, fast: bool = False
 ) -> Tuple[Dict[rules.ColumnNames, str], pd.DataFrame]:
     """
     Check traces GeoDataFrame column data against schema and report if needed.
@@ -391,12 +430,12 @@ def pandera_reporting(
     # Read traces from disk.
     # (Alternative is to keep GeoDataFrame in memory from multiprocessing
     # but that is risky.)
-    traces = general.read_geofile(update_tuple.traces_path)
+    traces = read_geofile(update_tuple.traces_path)
     if traces.empty:
         logging.error(f"Empty traces uncaught by validation for {update_tuple}.")
         return dict(), pd.DataFrame()
     try:
-        pandera_report = perform_pandera_check(traces, metadata=metadata)
+        pandera_report = perform_pandera_check(traces, metadata=metadata, fast=fast)
     except Exception as exc:
         logging.error(
             f"GeoDataFrame validation critically failed with {update_tuple} traces.",
@@ -418,6 +457,33 @@ def pandera_reporting(
     return dict(), pandera_report
 
 
+def pandera_reporting_batch(
+    update_tuples: Sequence[UpdateTuple],
+    metadata: rules.Metadata,
+    fast: bool = False,
+    max_workers: Optional[int] = None,
+) -> List[Tuple[Dict[rules.ColumnNames, str], pd.DataFrame]]:
+    """
+    Check and report multiple traces GeoDataFrames concurrently.
+
+    The schema is built once for ``metadata``. Datasets are checked
+    separately, not concatenated, as e.g. Lineament_ID uniqueness is
+    dataset-specific. Results are in the same order as ``update_tuples``.
+    """
+    # Build (and cache) the schema once before threads use it
+    trace_schema.traces_schema(metadata=metadata)
+
+    # Reading and checking the traces are independent between datasets so
+    # they are done in threads. executor.map keeps the order.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                partial(pandera_reporting, metadata=metadata, fast=fast),
+                update_tuples,
+            )
+        )
+
+
 def create_validation_table(
     invalids: List[TraceTuple], validity_changes: Optional[List[Text]] = None
 ) -> Table: